@@ -1,8 +1,11 @@
 import os
+import threading
 from flask import Flask, request, jsonify
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2.pool import ThreadedConnectionPool
 from psycopg2.extras import RealDictCursor
 
+from profiling import init_profiling
+
 DB_HOST = os.getenv("DB_HOST")
 DB_PORT = int(os.getenv("DB_PORT", "5432"))
 DB_NAME = os.getenv("DB_NAME")
@@ -13,22 +16,27 @@ if not all([DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD]):
     raise RuntimeError("One or more required environment variables are missing.")
 
 app = Flask(__name__)
+init_profiling(app)
 
 pool = None
+pool_lock = threading.Lock()
 
 def get_pool():
     """Lazy initialization of database connection pool"""
     global pool
     if pool is None:
-        pool = SimpleConnectionPool(
-            minconn=1,
-            maxconn=10,
-            host=DB_HOST,
-            port=DB_PORT,
-            dbname=DB_NAME,
-            user=DB_USER,
-            password=DB_PASSWORD,
-        )
+        # gunicorn runs gthread workers (see Dockerfile): only one thread may create the pool
+        with pool_lock:
+            if pool is None:
+                pool = ThreadedConnectionPool(
+                    minconn=1,
+                    maxconn=10,
+                    host=DB_HOST,
+                    port=DB_PORT,
+                    dbname=DB_NAME,
+                    user=DB_USER,
+                    password=DB_PASSWORD,
+                )
     return pool
 
 def query(sql, params=None, fetch=False):
@@ -0,0 +1,247 @@
+"""On-demand profiling for live API workers.
+
+Both tools are disabled unless PROFILE_TOKEN is set, and every use must
+present that token.
+
+- POST /admin/profile?seconds=N samples the stacks of every thread in the
+  worker that serves the request and returns them in collapsed-stack format
+  (one "frame;frame;frame count" line per stack), ready for flamegraph.pl or
+  speedscope. Threads parked in a wait (the gunicorn poll loop, idle gthread
+  pool threads) are left out unless idle=1 is passed.
+- A request carrying an "X-Debug-Profile: <token>" header has its own thread
+  sampled while it runs and gets the collapsed stacks back instead of its
+  normal body. Only that thread is sampled, so concurrent requests in the
+  worker neither show up in the report nor pay for it. At most one request per
+  worker is profiled at a time and at most one every PROFILE_REQUEST_INTERVAL
+  seconds; others are served unprofiled.
+
+cProfile is deliberately not used: on Python 3.12 it hooks in through
+sys.monitoring and records every thread of the gthread worker.
+"""
+import hmac
+import math
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from flask import Response, g, jsonify, request
+
+TOKEN_HEADER = "X-Profile-Token"
+DEBUG_HEADER = "X-Debug-Profile"
+
+DEFAULT_SECONDS = 10.0
+DEFAULT_INTERVAL = 0.01
+MIN_INTERVAL = 0.005
+MAX_INTERVAL = 1.0
+REQUEST_INTERVAL = MIN_INTERVAL
+
+# Innermost Python frames of a thread that is blocked waiting, not working.
+# "_worker" is the concurrent.futures pool loop, blocked in a C-level queue get.
+IDLE_FUNCTIONS = frozenset({"select", "poll", "wait", "acquire", "accept", "_worker"})
+
+_sampler_lock = threading.Lock()
+_request_lock = threading.Lock()
+_last_request_profile = 0.0
+
+
+def _token_valid(app, supplied):
+    """Constant-time check of a supplied token against PROFILE_TOKEN"""
+    expected = app.config.get("PROFILE_TOKEN")
+    if not expected or not supplied:
+        return False
+    return hmac.compare_digest(supplied.encode(), expected.encode())
+
+
+def _walk(frame, thread_name, labels):
+    """Root-first stack of labels for a frame, rooted at the thread name.
+
+    `labels` caches one label per code object for the sampling session, keyed
+    by id() and holding the code object so the id cannot be reused meanwhile.
+    """
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        cached = labels.get(id(code))
+        if cached is None:
+            cached = labels[id(code)] = (
+                code,
+                f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})",
+            )
+        stack.append(cached[1])
+        frame = frame.f_back
+    return (thread_name, *reversed(stack))
+
+
+def sample_stacks(seconds, interval=DEFAULT_INTERVAL, skip_threads=(), include_idle=False):
+    """Sample the Python stacks of all threads for `seconds` of wall time.
+
+    Returns a Counter mapping root-first stack tuples to sample counts.
+    Threads listed in skip_threads (idents) are left out, as are threads whose
+    innermost frame is a wait in IDLE_FUNCTIONS unless include_idle is set.
+    """
+    skip = set(skip_threads) | {threading.get_ident()}
+    names = {t.ident: t.name for t in threading.enumerate()}
+    labels = {}
+    stacks = Counter()
+    deadline = time.monotonic() + seconds
+
+    while time.monotonic() < deadline:
+        for ident, frame in sys._current_frames().items():
+            if ident in skip:
+                continue
+            if not include_idle and frame.f_code.co_name in IDLE_FUNCTIONS:
+                continue
+            stacks[_walk(frame, names.get(ident, f"thread-{ident}"), labels)] += 1
+        # Never sleep past the deadline, so seconds stays the upper bound
+        time.sleep(max(0.0, min(interval, deadline - time.monotonic())))
+
+    return stacks
+
+
+class ThreadSampler:
+    """Samples a single thread's stack from a background thread until stopped"""
+
+    def __init__(self, ident, interval=REQUEST_INTERVAL):
+        self.ident = ident
+        self.interval = interval
+        self.stacks = Counter()
+        self._labels = {}
+        self._name = threading.current_thread().name
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-sampler", daemon=True)
+
+    def _run(self):
+        while True:
+            frame = sys._current_frames().get(self.ident)
+            if frame is not None:
+                self.stacks[_walk(frame, self._name, self._labels)] += 1
+            if self._stop.wait(self.interval):
+                return
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop sampling and return the collected stacks"""
+        self._stop.set()
+        self._thread.join()
+        return self.stacks
+
+
+def collapse(stacks):
+    """Render sampled stacks in flamegraph collapsed-stack format"""
+    lines = [f"{';'.join(stack)} {count}" for stack, count in stacks.most_common()]
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
+def _float_arg(name, default):
+    value = request.args.get(name)
+    if value is None:
+        return default
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return number if math.isfinite(number) else None
+
+
+def profile_endpoint(app):
+    """POST /admin/profile - sample this worker and return collapsed stacks"""
+    if not app.config.get("PROFILE_TOKEN"):
+        return jsonify({"error": "Not found."}), 404
+    if not _token_valid(app, request.headers.get(TOKEN_HEADER)):
+        return jsonify({"error": "Invalid profile token."}), 403
+
+    seconds = _float_arg("seconds", DEFAULT_SECONDS)
+    interval = _float_arg("interval", DEFAULT_INTERVAL)
+    max_seconds = app.config["PROFILE_MAX_SECONDS"]
+    if seconds is None or not 0 < seconds <= max_seconds:
+        return jsonify({"error": f"seconds must be between 0 and {max_seconds:g}."}), 400
+    max_interval = min(MAX_INTERVAL, seconds)
+    if interval is None or not MIN_INTERVAL <= interval <= max_interval:
+        return (
+            jsonify({"error": f"interval must be between {MIN_INTERVAL:g} and {max_interval:g}."}),
+            400,
+        )
+
+    if not _sampler_lock.acquire(blocking=False):
+        return jsonify({"error": "A profile is already running in this worker."}), 409
+    try:
+        include_idle = request.args.get("idle", "0") not in ("0", "false", "")
+        stacks = sample_stacks(seconds, interval, include_idle=include_idle)
+    finally:
+        _sampler_lock.release()
+
+    resp = Response(collapse(stacks), mimetype="text/plain")
+    resp.headers["X-Profile-Samples"] = str(sum(stacks.values()))
+    resp.headers["X-Profile-Worker"] = str(os.getpid())
+    return resp
+
+
+def _start_request_profile(app):
+    """Start sampling this request's thread if asked for and within the overhead budget"""
+    global _last_request_profile
+
+    supplied = request.headers.get(DEBUG_HEADER)
+    if not supplied or not _token_valid(app, supplied):
+        return
+    if not _request_lock.acquire(blocking=False):
+        g.profile_skipped = "busy"
+        return
+
+    now = time.monotonic()
+    if now - _last_request_profile < app.config["PROFILE_REQUEST_INTERVAL"]:
+        _request_lock.release()
+        g.profile_skipped = "rate-limited"
+        return
+    _last_request_profile = now
+
+    g.profile_started = time.perf_counter()
+    g.profiler = ThreadSampler(threading.get_ident()).start()
+
+
+def _finish_request_profile(response):
+    """Replace the response body with the sampled stacks of the profiled request"""
+    skipped = g.pop("profile_skipped", None)
+    if skipped:
+        response.headers["X-Profile-Skipped"] = skipped
+        return response
+
+    profiler = g.get("profiler")
+    if profiler is None:
+        return response
+    stacks = profiler.stop()
+    elapsed_ms = (time.perf_counter() - g.profile_started) * 1000
+
+    profiled = Response(collapse(stacks), mimetype="text/plain")
+    profiled.headers["X-Profiled-Status"] = str(response.status_code)
+    profiled.headers["X-Profile-Samples"] = str(sum(stacks.values()))
+    profiled.headers["Server-Timing"] = f"profile;dur={elapsed_ms:.1f}"
+    return profiled
+
+
+def _release_request_profile(exc):
+    """Always stop the sampler and free the slot, including on errors"""
+    profiler = g.pop("profiler", None)
+    if profiler is not None:
+        profiler.stop()
+        _request_lock.release()
+
+
+def init_profiling(app):
+    """Register the profiling endpoint and per-request hooks on the app"""
+    app.config.setdefault("PROFILE_TOKEN", os.getenv("PROFILE_TOKEN"))
+    app.config.setdefault("PROFILE_MAX_SECONDS", float(os.getenv("PROFILE_MAX_SECONDS", "30")))
+    app.config.setdefault(
+        "PROFILE_REQUEST_INTERVAL", float(os.getenv("PROFILE_REQUEST_INTERVAL", "1"))
+    )
+
+    app.add_url_rule(
+        "/admin/profile", "admin_profile", lambda: profile_endpoint(app), methods=["POST"]
+    )
+    app.before_request(lambda: _start_request_profile(app))
+    app.after_request(_finish_request_profile)
+    app.teardown_request(_release_request_profile)
@@ -0,0 +1,32 @@
+import threading
+from unittest import mock
+
+import app as app_module
+
+
+def test_get_pool_creates_single_pool_under_concurrency(monkeypatch):
+    """Concurrent first requests in a gthread worker must share one pool"""
+    monkeypatch.setattr(app_module, "pool", None)
+    created = []
+    start = threading.Barrier(8)
+
+    def fake_pool(**kwargs):
+        created.append(kwargs)
+        return mock.Mock()
+
+    monkeypatch.setattr(app_module, "ThreadedConnectionPool", fake_pool)
+
+    results = []
+
+    def worker():
+        start.wait()
+        results.append(app_module.get_pool())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(created) == 1
+    assert all(result is results[0] for result in results)
@@ -0,0 +1,163 @@
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+import profiling
+from app import app
+from profiling import collapse, sample_stacks
+
+TOKEN = "test-profile-token"
+
+
+@pytest.fixture
+def profiling_enabled(monkeypatch):
+    """Enable profiling with a known token for the duration of a test"""
+    monkeypatch.setitem(app.config, "PROFILE_TOKEN", TOKEN)
+    monkeypatch.setitem(app.config, "PROFILE_REQUEST_INTERVAL", 0)
+
+
+@pytest.fixture(autouse=True)
+def reset_request_profile_clock(monkeypatch):
+    """Each test starts as if no request has been profiled in this worker yet"""
+    monkeypatch.setattr(profiling, "_last_request_profile", float("-inf"))
+
+
+def _busy_loop(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+def test_profile_endpoint_disabled_without_token(client, monkeypatch):
+    """Profiling endpoint is hidden unless PROFILE_TOKEN is configured"""
+    monkeypatch.setitem(app.config, "PROFILE_TOKEN", None)
+    resp = client.post("/admin/profile?seconds=0.1", headers={"X-Profile-Token": "anything"})
+    assert resp.status_code == 404
+
+
+def test_profile_endpoint_rejects_wrong_token(client, profiling_enabled):
+    resp = client.post("/admin/profile?seconds=0.1", headers={"X-Profile-Token": "wrong"})
+    assert resp.status_code == 403
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        "seconds=0",
+        "seconds=9999",
+        "seconds=abc",
+        "seconds=nan",
+        "seconds=inf",
+        "interval=0",
+        "interval=0.001",
+        "interval=nan",
+        "interval=inf",
+        "interval=3600",
+        "seconds=0.1&interval=0.5",
+    ],
+)
+def test_profile_endpoint_validates_arguments(client, profiling_enabled, args):
+    resp = client.post(f"/admin/profile?{args}", headers={"X-Profile-Token": TOKEN})
+    assert resp.status_code == 400
+
+
+def test_profile_endpoint_returns_collapsed_stacks(client, profiling_enabled):
+    """Samples other threads and returns 'frame;frame count' lines"""
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_loop, args=(stop,), name="busy-worker")
+    worker.start()
+    try:
+        resp = client.post(
+            "/admin/profile?seconds=0.2&interval=0.005", headers={"X-Profile-Token": TOKEN}
+        )
+    finally:
+        stop.set()
+        worker.join()
+
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/plain"
+    assert int(resp.headers["X-Profile-Samples"]) > 0
+
+    lines = resp.get_data(as_text=True).splitlines()
+    busy = [line for line in lines if line.startswith("busy-worker;")]
+    assert busy, lines
+    stack, count = busy[0].rsplit(" ", 1)
+    assert "_busy_loop" in stack
+    assert int(count) > 0
+
+
+def test_sample_stacks_skips_calling_thread():
+    stacks = sample_stacks(0.02, interval=0.005)
+    current = threading.current_thread().name
+    assert all(stack[0] != current for stack in stacks)
+
+
+def test_collapse_empty_profile():
+    assert collapse(Counter()) == ""
+
+
+def test_debug_header_returns_request_stacks(client, profiling_enabled):
+    resp = client.get("/healthz", headers={"X-Debug-Profile": TOKEN})
+    assert resp.status_code == 200
+    assert resp.headers["X-Profiled-Status"] == "200"
+    assert "Server-Timing" in resp.headers
+    assert int(resp.headers["X-Profile-Samples"]) > 0
+    assert resp.get_data(as_text=True).startswith(threading.current_thread().name + ";")
+
+
+def test_debug_header_profiles_only_the_request_thread(client, profiling_enabled):
+    """Work running concurrently in another thread must not appear in the report"""
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_loop, args=(stop,), name="busy-worker")
+    worker.start()
+    try:
+        resp = client.get("/healthz", headers={"X-Debug-Profile": TOKEN})
+    finally:
+        stop.set()
+        worker.join()
+
+    report = resp.get_data(as_text=True)
+    assert int(resp.headers["X-Profile-Samples"]) > 0
+    assert "_busy_loop" not in report
+    assert "busy-worker" not in report
+
+
+def test_debug_header_with_wrong_token_is_ignored(client, profiling_enabled):
+    resp = client.get("/healthz", headers={"X-Debug-Profile": "wrong"})
+    assert resp.get_json() == {"status": "ok"}
+    assert "X-Profiled-Status" not in resp.headers
+
+
+def test_debug_header_is_rate_limited(client, profiling_enabled, monkeypatch):
+    """Only one profiled request per PROFILE_REQUEST_INTERVAL per worker"""
+    monkeypatch.setitem(app.config, "PROFILE_REQUEST_INTERVAL", 60)
+    first = client.get("/healthz", headers={"X-Debug-Profile": TOKEN})
+    assert first.headers["X-Profiled-Status"] == "200"
+
+    resp = client.get("/healthz", headers={"X-Debug-Profile": TOKEN})
+    assert resp.get_json() == {"status": "ok"}
+    assert resp.headers["X-Profile-Skipped"] == "rate-limited"
+
+
+def test_sample_stacks_does_not_overrun_deadline():
+    """A long interval is cut short at the deadline instead of sleeping in full"""
+    started = time.monotonic()
+    sample_stacks(0.05, interval=2)
+    assert time.monotonic() - started < 1
+
+
+def test_sample_stacks_drops_idle_threads_unless_asked():
+    """Threads blocked in a wait are noise for a CPU profile and skipped by default"""
+    stop = threading.Event()
+    waiter = threading.Thread(target=stop.wait, name="idle-waiter")
+    waiter.start()
+    try:
+        busy = sample_stacks(0.05)
+        everything = sample_stacks(0.05, include_idle=True)
+    finally:
+        stop.set()
+        waiter.join()
+
+    assert not any(stack[0] == "idle-waiter" for stack in busy)
+    assert any(stack[0] == "idle-waiter" for stack in everything)
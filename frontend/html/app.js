@@ -87,8 +87,9 @@ class NameListApp {
       // Announce page change
       accessibilityService.announcePageChange({
         currentPage: data.currentPage,
-        totalPages: Math.ceil(data.totalItems / data.pageSize),
+        totalPages: appState.paginationInfo.totalPages,
         pageSize: data.pageSize,
+        totalItems: data.totalItems,
         pageSizeChanged: data.pageSizeChanged,
       });
     });
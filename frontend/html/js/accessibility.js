@@ -68,7 +68,9 @@ class AccessibilityService {
 
     let message = '';
 
-    if (info.pageSizeChanged) {
+    if (info.pageSizeChanged && info.pageSize === AppState.PAGE_SIZE_ALL) {
+      message = `Showing all ${info.totalItems} items in a scrolling list.`;
+    } else if (info.pageSizeChanged) {
       message = `Page size changed to ${info.pageSize} items per page. Now on page 1 of ${Math.ceil(
         info.totalItems / info.pageSize
       )}.`;
@@ -4,11 +4,19 @@
  */
 
 class AppState {
+  /**
+   * Page size value meaning "show every item in one scrolling (virtualized) list"
+   */
+  static PAGE_SIZE_ALL = 0;
+
   constructor() {
     // Core data
-    this._data = [];
+    this._data = Object.freeze([]);
     this._sortMode = SortingService.getDefaultMode();
 
+    // Memoized sort result, valid while _data and _sortMode are unchanged
+    this._sortedCache = null;
+
     // Pagination state
     this._currentPage = 1;
     this._pageSize = 10;
@@ -71,7 +79,7 @@ class AppState {
 
   // Data getters and setters
   get data() {
-    return [...this._data]; // Return a copy to prevent mutation
+    return this._data; // Frozen in setData, so safe to share without copying
   }
 
   setData(newData) {
@@ -80,7 +88,8 @@ class AppState {
       return;
     }
 
-    this._data = [...newData];
+    this._data = Object.freeze([...newData]);
+    this._sortedCache = null;
     this._totalItems = newData.length;
 
     // Reset to first page when data changes
@@ -136,8 +145,18 @@ class AppState {
     return this._pageSize;
   }
 
+  /**
+   * Number of items actually shown per page (resolves PAGE_SIZE_ALL)
+   */
+  get _effectivePageSize() {
+    if (this._pageSize === AppState.PAGE_SIZE_ALL) {
+      return Math.max(1, this._totalItems);
+    }
+    return this._pageSize;
+  }
+
   setCurrentPage(newPage) {
-    const maxPage = Math.max(1, Math.ceil(this._totalItems / this._pageSize));
+    const maxPage = Math.max(1, Math.ceil(this._totalItems / this._effectivePageSize));
     const safePage = Math.max(1, Math.min(newPage, maxPage));
 
     if (this._currentPage === safePage) {
@@ -156,7 +175,7 @@ class AppState {
   }
 
   setPageSize(newSize) {
-    const validSizes = [10, 25, 50, 100];
+    const validSizes = [10, 25, 50, 100, AppState.PAGE_SIZE_ALL];
     if (!validSizes.includes(newSize)) {
       console.warn('AppState.setPageSize: invalid page size:', newSize);
       return;
@@ -222,14 +241,22 @@ class AppState {
 
   // Computed properties
   get sortedData() {
-    return SortingService.sortNames(this._data, this._sortMode);
+    const cache = this._sortedCache;
+    if (cache && cache.data === this._data && cache.sortMode === this._sortMode) {
+      return cache.result;
+    }
+
+    const result = Object.freeze(SortingService.sortNames(this._data, this._sortMode));
+    this._sortedCache = { data: this._data, sortMode: this._sortMode, result };
+    return result;
   }
 
   get paginationInfo() {
-    const totalPages = Math.max(1, Math.ceil(this._totalItems / this._pageSize));
+    const pageSize = this._effectivePageSize;
+    const totalPages = Math.max(1, Math.ceil(this._totalItems / pageSize));
     const safePage = Math.max(1, Math.min(this._currentPage, totalPages));
-    const startIndex = (safePage - 1) * this._pageSize;
-    const endIndex = Math.min(startIndex + this._pageSize, this._totalItems);
+    const startIndex = (safePage - 1) * pageSize;
+    const endIndex = Math.min(startIndex + pageSize, this._totalItems);
 
     return {
       totalPages,
@@ -248,12 +275,16 @@ class AppState {
     const pageInfo = this.paginationInfo;
 
     if (!Array.isArray(sortedData)) return [];
+    if (pageInfo.startIndex === 0 && pageInfo.endIndex === sortedData.length) {
+      return sortedData; // Whole list on one page, no need to copy
+    }
     return sortedData.slice(pageInfo.startIndex, pageInfo.endIndex);
   }
 
   // Utility methods
   reset() {
-    this._data = [];
+    this._data = Object.freeze([]);
+    this._sortedCache = null;
     this._sortMode = SortingService.getDefaultMode();
     this._currentPage = 1;
     this._pageSize = 10;
@@ -50,23 +50,22 @@ class UIService {
 
   /**
    * Render the names list
+   * Rows are keyed by item id and reused across renders; long lists are windowed
+   * so only the visible rows are kept in the DOM.
    * @param {Array} items - Array of name objects to render
    */
   renderList(items) {
     if (!this.elements.list) return;
 
-    this.elements.list.innerHTML = '';
-
-    if (!Array.isArray(items) || items.length === 0) {
-      this.elements.list.innerHTML =
-        '<li style="color: #666; font-style: italic;">No names yet</li>';
-      return;
+    if (!this.virtualList) {
+      this.elements.list.innerHTML = '';
+      this.virtualList = new VirtualList(this.elements.list, {
+        createRow: (item, index) => this._createListItem(item, index + 1),
+        updateRow: (li, item, index) => this._updateListItem(li, item, index + 1),
+      });
     }
 
-    items.forEach((item, index) => {
-      const li = this._createListItem(item, index + 1);
-      this.elements.list.appendChild(li);
-    });
+    this.virtualList.setItems(items);
   }
 
   /**
@@ -80,24 +79,44 @@ class UIService {
 
     // Name span
     const nameSpan = document.createElement('span');
-    nameSpan.textContent = `${displayIndex}. ${item.name}`;
+    nameSpan.className = 'name-text';
 
-    // Delete button
+    // Delete button (clicks are handled by the delegated listener on the list)
     const deleteBtn = document.createElement('button');
     deleteBtn.className = 'delete-btn';
     deleteBtn.innerHTML = '<i class="fas fa-trash"></i>';
-    deleteBtn.setAttribute('aria-label', `Delete ${item.name}`);
-    deleteBtn.title = `Delete ${item.name}`;
-
-    // Store item ID for delete callback
-    deleteBtn.dataset.itemId = item.id;
 
     li.appendChild(nameSpan);
     li.appendChild(deleteBtn);
 
+    this._updateListItem(li, item, displayIndex);
     return li;
   }
 
+  /**
+   * Refresh a reused list item, touching only the properties that changed
+   * @param {HTMLElement} li - List item element created by _createListItem
+   * @param {Object} item - Name object with id, name, created_at
+   * @param {number} displayIndex - 1-based display index
+   */
+  _updateListItem(li, item, displayIndex) {
+    const nameSpan = li.firstChild;
+    const deleteBtn = li.lastChild;
+
+    const text = `${displayIndex}. ${item.name}`;
+    if (nameSpan.textContent !== text) {
+      nameSpan.textContent = text;
+    }
+
+    const label = `Delete ${item.name}`;
+    if (deleteBtn.dataset.itemId !== String(item.id) || deleteBtn.title !== label) {
+      // Store item ID for delete callback
+      deleteBtn.dataset.itemId = item.id;
+      deleteBtn.setAttribute('aria-label', label);
+      deleteBtn.title = label;
+    }
+  }
+
   /**
    * Update sort button states
    * @param {string} activeSortMode - Currently active sort mode
@@ -253,12 +272,14 @@ class UIService {
   updatePageSizeButtons(activePageSize) {
     this.elements.pageSizeButtons.forEach((btn) => {
       const size = parseInt(btn.getAttribute('data-size'));
+      const baseLabel =
+        size === AppState.PAGE_SIZE_ALL ? 'Show all items' : `Show ${size} items per page`;
       if (size === activePageSize) {
         btn.classList.add('active');
-        btn.setAttribute('aria-label', `Show ${size} items per page, currently active`);
+        btn.setAttribute('aria-label', `${baseLabel}, currently active`);
       } else {
         btn.classList.remove('active');
-        btn.setAttribute('aria-label', `Show ${size} items per page`);
+        btn.setAttribute('aria-label', baseLabel);
       }
     });
   }
@@ -364,7 +385,7 @@ class UIService {
       if (callbacks.onPageSizeChange) {
         btn.addEventListener('click', () => {
           const newSize = parseInt(btn.getAttribute('data-size'));
-          if (newSize) {
+          if (!Number.isNaN(newSize)) {
             callbacks.onPageSizeChange(newSize);
           }
         });
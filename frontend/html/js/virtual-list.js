@@ -0,0 +1,296 @@
+/**
+ * Virtualized List Rendering
+ * Keyed, windowed rendering of list rows so large lists only keep visible rows in the DOM
+ */
+
+class VirtualList {
+  /**
+   * Lists longer than this are windowed; shorter lists render every row
+   */
+  static THRESHOLD = 200;
+
+  /**
+   * @param {HTMLElement} container - List element (<ul>) that owns the rows
+   * @param {Object} options - Rendering options
+   * @param {Function} options.createRow - (item, index) => HTMLElement for a new row
+   * @param {Function} options.updateRow - (row, item, index) => void, refresh a reused row
+   * @param {Function} [options.getKey] - item => unique key (defaults to item.id)
+   * @param {number} [options.rowHeight] - Row height in px (measured from the first row if omitted)
+   * @param {number} [options.viewportHeight] - Fallback viewport height in px
+   * @param {number} [options.overscan] - Extra rows rendered above and below the viewport
+   * @param {number} [options.threshold] - Item count above which windowing is enabled
+   */
+  constructor(container, options = {}) {
+    this.container = container;
+    this.createRow = options.createRow;
+    this.updateRow = options.updateRow;
+    this.getKey = options.getKey || ((item) => item.id);
+    this.rowHeight = options.rowHeight || 0;
+    this.viewportHeight = options.viewportHeight || 480;
+    this.overscan = options.overscan !== undefined ? options.overscan : 10;
+    this.threshold = options.threshold !== undefined ? options.threshold : VirtualList.THRESHOLD;
+
+    this.items = [];
+    this.isVirtualized = false;
+
+    // Rendered rows by key, in DOM order
+    this._rows = new Map();
+    this._emptyRow = null;
+
+    // Spacers stand in for the rows above and below the rendered window
+    this._topSpacer = this._createSpacer();
+    this._bottomSpacer = this._createSpacer();
+    this.container.appendChild(this._topSpacer);
+    this.container.appendChild(this._bottomSpacer);
+
+    this._scrollScheduled = false;
+    this._onScroll = () => this._scheduleWindowRender();
+  }
+
+  /**
+   * Replace the rendered items, reusing existing rows by key
+   * @param {Array} items - Array of items to render
+   */
+  setItems(items) {
+    this.items = Array.isArray(items) ? items : [];
+    this._setVirtualized(this.items.length > this.threshold);
+
+    if (this.items.length === 0) {
+      this._reconcile(0, 0);
+      this._showEmpty(true);
+      return;
+    }
+
+    this._showEmpty(false);
+    this.renderWindow();
+  }
+
+  /**
+   * Render the rows currently inside the viewport (all rows when not virtualized)
+   */
+  renderWindow() {
+    const total = this.items.length;
+
+    if (!this.isVirtualized) {
+      this._reconcile(0, total);
+      this._setSpacerHeights(0, 0);
+      return;
+    }
+
+    if (!this.rowHeight) {
+      // Render one row to measure the height every row is laid out with
+      this._reconcile(0, Math.min(total, 1));
+      // getBoundingClientRect keeps fractional px (2.6rem rows are 41.6px); offsetHeight
+      // rounds, and the error adds up across the spacers of long lists
+      const measured = this._rows.size
+        ? this._rows.values().next().value.getBoundingClientRect().height
+        : 0;
+      this.rowHeight = measured || 41;
+    }
+
+    // The list may have shrunk while scrolled down: keep the viewport inside it
+    const maxScrollTop = Math.max(0, total * this.rowHeight - this._viewportHeight());
+    if (this.container.scrollTop > maxScrollTop) {
+      this.container.scrollTop = maxScrollTop;
+    }
+
+    const { start, end } = this.getWindow();
+    this._reconcile(start, end);
+    this._setSpacerHeights(start * this.rowHeight, (total - end) * this.rowHeight);
+  }
+
+  /**
+   * Compute the index range of rows to render for the current scroll position
+   * @returns {{start: number, end: number}} - Half-open index range
+   */
+  getWindow() {
+    const total = this.items.length;
+    if (!this.isVirtualized) {
+      return { start: 0, end: total };
+    }
+
+    const rowHeight = this.rowHeight || 41;
+    const scrollTop = this.container.scrollTop || 0;
+    const visible = Math.ceil(this._viewportHeight() / rowHeight);
+    const first = Math.min(Math.floor(scrollTop / rowHeight), Math.max(0, total - visible));
+
+    const start = Math.max(0, first - this.overscan);
+    const end = Math.min(total, first + visible + this.overscan);
+    return { start, end };
+  }
+
+  /**
+   * Height of the scrolling viewport in px
+   * @returns {number}
+   */
+  _viewportHeight() {
+    return this.container.clientHeight || this.viewportHeight;
+  }
+
+  /**
+   * Scroll so that the row at the given index is at the top of the viewport
+   * @param {number} index - 0-based item index
+   */
+  scrollToIndex(index) {
+    if (!this.isVirtualized) return;
+    this.container.scrollTop = Math.max(0, index) * (this.rowHeight || 41);
+    this.renderWindow();
+  }
+
+  /**
+   * Number of rows currently present in the DOM
+   * @returns {number}
+   */
+  get renderedCount() {
+    return this._rows.size;
+  }
+
+  /**
+   * Keyed diff of rows [start, end) against the rows already in the DOM.
+   * Unchanged rows are reused, so adds and deletes only touch the affected nodes.
+   * @param {number} start - First item index to render
+   * @param {number} end - Index after the last item to render
+   */
+  _reconcile(start, end) {
+    const wanted = new Set();
+    for (let i = start; i < end; i++) {
+      wanted.add(String(this.getKey(this.items[i])));
+    }
+
+    const nextRows = new Map();
+    let cursor = this._topSpacer.nextSibling;
+
+    for (let i = start; i < end; i++) {
+      // Drop stale rows sitting where the next wanted row belongs
+      while (cursor && cursor !== this._bottomSpacer && !wanted.has(cursor.dataset.key)) {
+        const stale = cursor;
+        cursor = cursor.nextSibling;
+        this._removeRow(stale);
+      }
+
+      const item = this.items[i];
+      const key = String(this.getKey(item));
+      let row = this._rows.get(key);
+
+      if (row) {
+        this._rows.delete(key);
+        this.updateRow(row, item, i);
+      } else {
+        row = this.createRow(item, i);
+        row.dataset.key = key;
+      }
+      this._setPosition(row, i);
+
+      if (row === cursor) {
+        cursor = cursor.nextSibling;
+      } else {
+        this.container.insertBefore(row, cursor);
+      }
+      nextRows.set(key, row);
+    }
+
+    // Whatever was not reused has left the window or the list
+    this._rows.forEach((row) => this._removeRow(row));
+    this._rows = nextRows;
+  }
+
+  /**
+   * Remove a row element from the list
+   * @param {HTMLElement} row - Row element
+   */
+  _removeRow(row) {
+    if (row.parentNode === this.container) {
+      this.container.removeChild(row);
+    }
+  }
+
+  /**
+   * Expose list position to assistive technology when only a window is rendered
+   * @param {HTMLElement} row - Row element
+   * @param {number} index - 0-based item index
+   */
+  _setPosition(row, index) {
+    if (this.isVirtualized) {
+      row.setAttribute('aria-posinset', String(index + 1));
+      row.setAttribute('aria-setsize', String(this.items.length));
+    } else if (row.hasAttribute('aria-posinset')) {
+      row.removeAttribute('aria-posinset');
+      row.removeAttribute('aria-setsize');
+    }
+  }
+
+  /**
+   * Toggle windowed mode and the scroll container behaviour that goes with it
+   * @param {boolean} enabled - Whether to virtualize
+   */
+  _setVirtualized(enabled) {
+    if (this.isVirtualized === enabled) return;
+    this.isVirtualized = enabled;
+
+    if (enabled) {
+      this.container.classList.add('virtualized');
+      this.container.addEventListener('scroll', this._onScroll);
+    } else {
+      this.container.classList.remove('virtualized');
+      this.container.removeEventListener('scroll', this._onScroll);
+      this.container.scrollTop = 0;
+    }
+  }
+
+  /**
+   * Coalesce scroll events into one window render per animation frame
+   */
+  _scheduleWindowRender() {
+    if (this._scrollScheduled) return;
+    this._scrollScheduled = true;
+
+    const run = () => {
+      this._scrollScheduled = false;
+      this.renderWindow();
+    };
+
+    if (typeof requestAnimationFrame === 'function') {
+      requestAnimationFrame(run);
+    } else {
+      setTimeout(run, 0);
+    }
+  }
+
+  /**
+   * Show or hide the empty-list placeholder
+   * @param {boolean} visible - Whether the placeholder should be shown
+   */
+  _showEmpty(visible) {
+    if (visible && !this._emptyRow) {
+      this._emptyRow = document.createElement('li');
+      this._emptyRow.className = 'empty-row';
+      this._emptyRow.textContent = 'No names yet';
+      this.container.insertBefore(this._emptyRow, this._bottomSpacer);
+    } else if (!visible && this._emptyRow) {
+      this._removeRow(this._emptyRow);
+      this._emptyRow = null;
+    }
+  }
+
+  /**
+   * Create a spacer element that reserves scroll height for unrendered rows
+   * @returns {HTMLElement} - Spacer element
+   */
+  _createSpacer() {
+    const spacer = document.createElement('li');
+    spacer.className = 'virtual-spacer';
+    spacer.setAttribute('aria-hidden', 'true');
+    spacer.style.height = '0px';
+    return spacer;
+  }
+
+  /**
+   * Set the heights of the spacers around the rendered window
+   * @param {number} top - Height above the window in px
+   * @param {number} bottom - Height below the window in px
+   */
+  _setSpacerHeights(top, bottom) {
+    this._topSpacer.style.height = `${top}px`;
+    this._bottomSpacer.style.height = `${bottom}px`;
+  }
+}
@@ -0,0 +1,237 @@
+#!/usr/bin/env node
+
+/**
+ * Production build for the static frontend
+ *
+ * Bundles the scripts referenced by index.html into a single minified file,
+ * fingerprints it with a content hash and emits precompressed .gz/.br
+ * variants next to it. index.html is rewritten to load the bundle.
+ *
+ * Runs on plain Node.js (no npm dependencies) so it can execute in the
+ * frontend Dockerfile build stage.
+ *
+ * Usage: node scripts/build.js [srcDir] [outDir]
+ */
+
+const crypto = require('crypto');
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+const zlib = require('zlib');
+
+const ROOT = path.join(__dirname, '..');
+const SRC_DIR = path.resolve(process.argv[2] || path.join(ROOT, 'html'));
+const OUT_DIR = path.resolve(process.argv[3] || path.join(ROOT, 'dist'));
+const ASSETS_DIR = 'assets';
+
+// Matches local <script src="..."></script> tags (external URLs are left alone)
+const SCRIPT_TAG = /[ \t]*<script src="(\.?\/?(?!https?:)[^"]+\.js)"><\/script>\n?/g;
+
+// Characters after which a "/" starts a regular expression rather than a division
+const REGEX_PRECEDERS = new Set('(,=:[!&|?{};+-*%<>~^\n'.split(''));
+const REGEX_KEYWORDS = /(?:^|[^\w$])(?:return|typeof|instanceof|in|of|new|delete|void|throw|case|do|else)$/;
+
+/**
+ * Strip comments and indentation from JavaScript source.
+ *
+ * Conservative on purpose: line breaks are kept so automatic semicolon
+ * insertion behaves exactly as in the original files. String, template and
+ * regular expression literals are copied verbatim; code inside template
+ * `${...}` substitutions is minified like any other code, so nested
+ * templates are handled.
+ * @param {string} source - JavaScript source code
+ * @returns {string} - Minified source
+ */
+function minify(source) {
+  let out = '';
+  let i = 0;
+  const n = source.length;
+
+  // One entry per open template substitution: the depth of plain `{` braces inside it
+  const substitutions = [];
+
+  const lastSignificant = () => {
+    const trimmed = out.replace(/[ \t]+$/, '');
+    return trimmed.length ? trimmed[trimmed.length - 1] : '\n';
+  };
+
+  const copyQuoted = (quote) => {
+    const start = i++;
+    while (i < n && source[i] !== quote) {
+      i += source[i] === '\\' ? 2 : 1;
+    }
+    i++;
+    out += source.slice(start, i);
+  };
+
+  // Copy template text from a backtick, or from the `}` that closes a substitution,
+  // up to the closing backtick or the next `${`
+  const copyTemplate = () => {
+    const start = i++;
+    while (i < n) {
+      const ch = source[i];
+      if (ch === '\\') {
+        i += 2;
+      } else if (ch === '`') {
+        i++;
+        break;
+      } else if (ch === '$' && source[i + 1] === '{') {
+        i += 2;
+        substitutions.push(0);
+        break;
+      } else {
+        i++;
+      }
+    }
+    out += source.slice(start, i);
+  };
+
+  const copyRegex = () => {
+    const start = i++;
+    let inClass = false;
+    while (i < n) {
+      const ch = source[i];
+      if (ch === '\\') {
+        i += 2;
+        continue;
+      }
+      if (ch === '[') inClass = true;
+      else if (ch === ']') inClass = false;
+      else if (ch === '/' && !inClass) break;
+      i++;
+    }
+    i++;
+    while (i < n && /[a-z]/i.test(source[i])) i++;
+    out += source.slice(start, i);
+  };
+
+  while (i < n) {
+    const ch = source[i];
+    const next = source[i + 1];
+
+    if (ch === '/' && next === '/') {
+      while (i < n && source[i] !== '\n') i++;
+    } else if (ch === '/' && next === '*') {
+      const end = source.indexOf('*/', i + 2);
+      i = end === -1 ? n : end + 2;
+    } else if (ch === '"' || ch === "'") {
+      copyQuoted(ch);
+    } else if (ch === '`') {
+      copyTemplate();
+    } else if ((ch === '{' || ch === '}') && substitutions.length) {
+      const depth = substitutions.length - 1;
+      if (ch === '}' && substitutions[depth] === 0) {
+        // Closes the substitution: back to template text
+        substitutions.pop();
+        copyTemplate();
+        continue;
+      }
+      substitutions[depth] += ch === '{' ? 1 : -1;
+      out += ch;
+      i++;
+    } else if (ch === '/') {
+      const prev = lastSignificant();
+      if (REGEX_PRECEDERS.has(prev) || REGEX_KEYWORDS.test(out.trimEnd())) {
+        copyRegex();
+      } else {
+        out += ch;
+        i++;
+      }
+    } else if (ch === '\n' || ch === '\r') {
+      out = out.replace(/[ \t]+$/, '');
+      if (out.length && out[out.length - 1] !== '\n') out += '\n';
+      i++;
+      while (i < n && /[ \t\r]/.test(source[i])) i++;
+    } else {
+      out += ch;
+      i++;
+    }
+  }
+
+  return out.trim() + '\n';
+}
+
+/**
+ * Write a file together with its gzip and brotli compressed variants
+ * @param {string} filePath - Destination path
+ * @param {string|Buffer} contents - File contents
+ */
+function writeWithPrecompressed(filePath, contents) {
+  const buffer = Buffer.isBuffer(contents) ? contents : Buffer.from(contents);
+  fs.writeFileSync(filePath, buffer);
+  fs.writeFileSync(`${filePath}.gz`, zlib.gzipSync(buffer, { level: zlib.constants.Z_BEST_COMPRESSION }));
+  fs.writeFileSync(
+    `${filePath}.br`,
+    zlib.brotliCompressSync(buffer, {
+      params: {
+        [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+        [zlib.constants.BROTLI_PARAM_SIZE_HINT]: buffer.length,
+      },
+    })
+  );
+}
+
+function build() {
+  const indexPath = path.join(SRC_DIR, 'index.html');
+  const html = fs.readFileSync(indexPath, 'utf8');
+
+  // Collect scripts in the order index.html loads them
+  const scripts = [...html.matchAll(SCRIPT_TAG)].map((match) => match[1]);
+  if (scripts.length === 0) {
+    throw new Error(`No local <script> tags found in ${indexPath}`);
+  }
+
+  const bundle = scripts
+    .map((src) => {
+      const source = fs.readFileSync(path.join(SRC_DIR, src), 'utf8');
+      return `// ${src.replace(/^\.\//, '')}\n${minify(source)}`;
+    })
+    .join(';\n');
+
+  // Refuse to ship a bundle that does not parse: it would be cached as immutable
+  try {
+    new vm.Script(bundle, { filename: 'bundle.js' });
+  } catch (error) {
+    throw new Error(`Bundle does not parse: ${error.message}`);
+  }
+
+  const hash = crypto.createHash('sha256').update(bundle).digest('hex').slice(0, 10);
+  const bundleName = `${ASSETS_DIR}/app.${hash}.js`;
+
+  // Rewrite index.html: the first script tag becomes the bundle, the rest are dropped
+  let replaced = false;
+  const outHtml = html.replace(SCRIPT_TAG, (tag) => {
+    if (replaced) return '';
+    replaced = true;
+    const indent = tag.match(/^[ \t]*/)[0];
+    return `${indent}<script src="/${bundleName}"></script>\n`;
+  });
+
+  fs.rmSync(OUT_DIR, { recursive: true, force: true });
+  fs.mkdirSync(path.join(OUT_DIR, ASSETS_DIR), { recursive: true });
+
+  writeWithPrecompressed(path.join(OUT_DIR, bundleName), bundle);
+  writeWithPrecompressed(path.join(OUT_DIR, 'index.html'), outHtml);
+
+  const sourceBytes = scripts.reduce(
+    (total, src) => total + fs.statSync(path.join(SRC_DIR, src)).size,
+    0
+  );
+  const outPath = path.join(OUT_DIR, bundleName);
+  console.log(`Bundled ${scripts.length} scripts -> ${bundleName}`);
+  console.log(`  source:   ${sourceBytes} bytes`);
+  console.log(`  minified: ${fs.statSync(outPath).size} bytes`);
+  console.log(`  gzip:     ${fs.statSync(`${outPath}.gz`).size} bytes`);
+  console.log(`  brotli:   ${fs.statSync(`${outPath}.br`).size} bytes`);
+}
+
+if (require.main === module) {
+  try {
+    build();
+  } catch (error) {
+    console.error('Build failed:', error.message);
+    process.exit(1);
+  }
+}
+
+module.exports = { minify, build };
@@ -0,0 +1,304 @@
+#!/usr/bin/env node
+
+/**
+ * List rendering benchmark
+ *
+ * Measures UIService.renderList at 10k and 100k items against the previous
+ * "clear innerHTML and rebuild every row" approach. Runs in plain Node.js with
+ * a minimal DOM shim, so timings reflect the JavaScript and DOM-operation work
+ * done per render (node creation, insertion, removal), not browser layout.
+ *
+ * Usage: node tests/perf/bench_render.js [sizes...]
+ */
+
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+// ---------------------------------------------------------------------------
+// Minimal DOM shim (doubly linked children so insert/remove are O(1))
+// ---------------------------------------------------------------------------
+
+let nodesCreated = 0;
+
+class FakeElement {
+  constructor(tagName) {
+    nodesCreated++;
+    this.tagName = tagName.toUpperCase();
+    this.parentNode = null;
+    this.firstChild = null;
+    this.lastChild = null;
+    this.nextSibling = null;
+    this.previousSibling = null;
+    this.childCount = 0;
+    this.dataset = {};
+    this.style = {};
+    this.attributes = {};
+    this.className = '';
+    this.textContent = '';
+    this.title = '';
+    this.scrollTop = 0;
+    this.clientHeight = 480;
+    this.offsetHeight = 42;
+    this.rectHeight = 41.6; // 2.6rem rows at the default font size
+    this._classes = new Set();
+    this.classList = {
+      add: (name) => this._classes.add(name),
+      remove: (name) => this._classes.delete(name),
+      contains: (name) => this._classes.has(name),
+    };
+  }
+
+  set innerHTML(value) {
+    while (this.firstChild) this.removeChild(this.firstChild);
+    if (value) this.appendChild(new FakeElement('i'));
+  }
+
+  appendChild(child) {
+    return this.insertBefore(child, null);
+  }
+
+  insertBefore(child, ref) {
+    if (child.parentNode) child.parentNode.removeChild(child);
+    child.parentNode = this;
+    child.nextSibling = ref;
+    child.previousSibling = ref ? ref.previousSibling : this.lastChild;
+    if (child.previousSibling) child.previousSibling.nextSibling = child;
+    else this.firstChild = child;
+    if (ref) ref.previousSibling = child;
+    else this.lastChild = child;
+    this.childCount++;
+    return child;
+  }
+
+  removeChild(child) {
+    if (child.previousSibling) child.previousSibling.nextSibling = child.nextSibling;
+    else this.firstChild = child.nextSibling;
+    if (child.nextSibling) child.nextSibling.previousSibling = child.previousSibling;
+    else this.lastChild = child.previousSibling;
+    child.parentNode = child.nextSibling = child.previousSibling = null;
+    this.childCount--;
+    return child;
+  }
+
+  setAttribute(name, value) {
+    this.attributes[name] = String(value);
+  }
+
+  getAttribute(name) {
+    return name in this.attributes ? this.attributes[name] : null;
+  }
+
+  hasAttribute(name) {
+    return name in this.attributes;
+  }
+
+  removeAttribute(name) {
+    delete this.attributes[name];
+  }
+
+  getBoundingClientRect() {
+    return { height: this.rectHeight };
+  }
+
+  addEventListener() {}
+
+  removeEventListener() {}
+}
+
+const elementsById = {};
+
+global.document = {
+  readyState: 'complete',
+  createElement: (tag) => new FakeElement(tag),
+  getElementById: (id) => (elementsById[id] = elementsById[id] || new FakeElement('div')),
+  querySelectorAll: () => [],
+  addEventListener() {},
+};
+global.window = { addEventListener() {} };
+
+// Load the frontend modules the same way index.html does (shared global scope)
+const htmlDir = path.join(__dirname, '../../html/js');
+const modules = ['sorting.js', 'state.js', 'virtual-list.js', 'ui.js'];
+const source = modules.map((file) => fs.readFileSync(path.join(htmlDir, file), 'utf8')).join('\n');
+const { AppState, uiService } = vm.runInThisContext(`${source}\n({ AppState, uiService });`);
+
+// ---------------------------------------------------------------------------
+// Benchmark helpers
+// ---------------------------------------------------------------------------
+
+function makeItems(count) {
+  const items = [];
+  const base = Date.parse('2025-10-10T00:00:00.000Z');
+  for (let i = 0; i < count; i++) {
+    items.push({
+      id: i + 1,
+      name: `Name ${String(i).padStart(6, '0')}`,
+      created_at: new Date(base + i * 1000).toISOString(),
+    });
+  }
+  return items;
+}
+
+/**
+ * The rendering strategy renderList used before keyed/virtualized rendering
+ */
+function legacyRenderList(list, items) {
+  list.innerHTML = '';
+  items.forEach((item, index) => {
+    const li = document.createElement('li');
+    const nameSpan = document.createElement('span');
+    nameSpan.textContent = `${index + 1}. ${item.name}`;
+    const deleteBtn = document.createElement('button');
+    deleteBtn.className = 'delete-btn';
+    deleteBtn.innerHTML = '<i class="fas fa-trash"></i>';
+    deleteBtn.setAttribute('aria-label', `Delete ${item.name}`);
+    deleteBtn.title = `Delete ${item.name}`;
+    deleteBtn.dataset.itemId = item.id;
+    li.appendChild(nameSpan);
+    li.appendChild(deleteBtn);
+    list.appendChild(li);
+  });
+}
+
+function time(fn, runs = 5) {
+  const samples = [];
+  for (let i = 0; i < runs; i++) {
+    const start = process.hrtime.bigint();
+    fn();
+    samples.push(Number(process.hrtime.bigint() - start) / 1e6);
+  }
+  samples.sort((a, b) => a - b);
+  return samples[Math.floor(samples.length / 2)];
+}
+
+function resetList() {
+  uiService.elements.list = elementsById.list = new FakeElement('ul');
+  uiService.virtualList = null;
+  return uiService.elements.list;
+}
+
+let failures = 0;
+
+function check(condition, message) {
+  if (!condition) {
+    failures++;
+    console.log(`  ✗ ${message}`);
+  }
+}
+
+function report(label, ms, extra = '') {
+  console.log(`  ${label.padEnd(34)} ${ms.toFixed(2).padStart(10)} ms ${extra}`);
+}
+
+// ---------------------------------------------------------------------------
+// Scenarios
+// ---------------------------------------------------------------------------
+
+function benchSize(count) {
+  console.log(`\n=== ${count.toLocaleString('en-US')} items ===`);
+  const items = makeItems(count);
+
+  // Baseline: rebuild every row
+  const legacyList = new FakeElement('ul');
+  const legacyMs = time(() => legacyRenderList(legacyList, items), 3);
+  report('legacy full rebuild', legacyMs, `(${legacyList.childCount} rows in DOM)`);
+
+  // State: repeated getter access no longer copies or re-sorts
+  const state = new AppState();
+  state.setData(items);
+  state.setPageSize(AppState.PAGE_SIZE_ALL);
+  report(
+    'AppState.data x100',
+    time(() => {
+      for (let i = 0; i < 100; i++) state.data;
+    })
+  );
+  report('AppState.currentPageData (cached)', time(() => state.currentPageData));
+
+  // Virtualized initial render
+  let list = resetList();
+  report(
+    'virtualized initial render',
+    time(() => {
+      list = resetList();
+      uiService.renderList(items);
+    })
+  );
+  const rendered = uiService.virtualList.renderedCount;
+  console.log(`  ${''.padEnd(34)} ${rendered} rows in DOM`);
+  check(uiService.virtualList.isVirtualized, 'list should be virtualized');
+  check(rendered < 100, `rendered rows should stay bounded (got ${rendered})`);
+  check(
+    uiService.virtualList.rowHeight === 41.6,
+    `row height should be measured without rounding (got ${uiService.virtualList.rowHeight})`
+  );
+
+  // Re-render with unchanged data
+  report('virtualized re-render (no change)', time(() => uiService.renderList(items)));
+
+  // Scroll to the middle of the list
+  const middle = Math.floor(count / 2);
+  report(
+    'virtualized scroll to middle',
+    time(() => {
+      list.scrollTop = 0;
+      uiService.virtualList.renderWindow();
+      uiService.virtualList.scrollToIndex(middle);
+    })
+  );
+  const firstRow = list.firstChild.nextSibling;
+  check(
+    firstRow && Number(firstRow.dataset.key) > middle - 20,
+    'window should follow the scroll position'
+  );
+
+  // Delete one visible row and add one at the top: only those rows change
+  const withoutOne = items.slice(0, middle + 1).concat(items.slice(middle + 2));
+  nodesCreated = 0;
+  report(
+    'virtualized delete one row',
+    time(() => {
+      uiService.renderList(items);
+      uiService.renderList(withoutOne);
+    })
+  );
+  // Per run: the deleted row is restored, and one row scrolls into the window (li, span, button, icon)
+  check(nodesCreated <= 5 * 2 * 4, `delete should reuse rows (created ${nodesCreated} nodes)`);
+
+  const withNew = [{ id: 0, name: 'New', created_at: items[0].created_at }].concat(items);
+  report(
+    'virtualized add one row',
+    time(() => {
+      uiService.renderList(items);
+      uiService.renderList(withNew);
+    })
+  );
+
+  // Shrink the list while scrolled to the bottom (e.g. a reload returning fewer rows)
+  uiService.renderList(items);
+  uiService.virtualList.scrollToIndex(count);
+  const fewer = items.slice(0, 300);
+  report('virtualized shrink while scrolled', time(() => uiService.renderList(fewer), 1));
+  const { rowHeight } = uiService.virtualList;
+  const topSpacer = parseFloat(list.firstChild.style.height);
+  check(
+    uiService.virtualList.renderedCount > 0,
+    'shrinking while scrolled should still render rows'
+  );
+  check(
+    topSpacer < fewer.length * rowHeight && list.scrollTop <= fewer.length * rowHeight,
+    `top spacer and scroll position should fit the shorter list (spacer ${topSpacer}px)`
+  );
+}
+
+const sizes = process.argv.slice(2).map(Number).filter(Boolean);
+(sizes.length ? sizes : [10000, 100000]).forEach(benchSize);
+
+console.log('');
+if (failures > 0) {
+  console.log(`❌ ${failures} benchmark checks failed`);
+  process.exit(1);
+} else {
+  console.log('✅ Benchmark checks passed');
+}
@@ -0,0 +1,86 @@
+#!/usr/bin/env node
+
+/**
+ * Unit tests for the build step's minifier (scripts/build.js)
+ * Each case is minified, checked to still parse, and evaluated to the same value
+ */
+
+const vm = require('vm');
+const { minify } = require('../../scripts/build.js');
+
+// Test counters
+let totalTests = 0;
+let passedTests = 0;
+
+function assert(condition, message) {
+  totalTests++;
+  if (condition) {
+    console.log(`✓ ${message}`);
+    passedTests++;
+  } else {
+    console.log(`✗ ${message}`);
+  }
+}
+
+/**
+ * Minify `source`, then check it parses and evaluates to the same result as the original
+ */
+function assertEquivalent(source, message) {
+  const minified = minify(source);
+  let same = false;
+  try {
+    same =
+      JSON.stringify(vm.runInNewContext(minified)) === JSON.stringify(vm.runInNewContext(source));
+  } catch (error) {
+    console.log(`  ${error.message}\n  minified: ${JSON.stringify(minified)}`);
+  }
+  assert(same, message);
+  return minified;
+}
+
+console.log('🧪 Running Minifier Unit Tests...\n');
+
+console.log('=== Comments ===');
+let out = assertEquivalent(
+  '// leading\nconst a = 1; /* block */\n/** doc\n * more */\na + 1;',
+  'strips comments'
+);
+assert(
+  !out.includes('leading') && !out.includes('block') && !out.includes('doc'),
+  'comment text removed'
+);
+out = assertEquivalent('    const a = 1;\n\n\n      a;', 'strips indentation and blank lines');
+assert(out === 'const a = 1;\na;\n', 'keeps one statement per line');
+
+console.log('\n=== Strings ===');
+assertEquivalent('"http://example.com/* not a comment */"', 'comment markers inside double quotes');
+assertEquivalent("'it\\'s // still a string'", 'escaped quote and // inside single quotes');
+assertEquivalent('`line one\n    indented // kept`', 'template text keeps whitespace and //');
+
+console.log('\n=== Regular expressions ===');
+assertEquivalent("'a, currently active'.replace(/, currently active/g, '')", 'regex after (');
+assertEquivalent("const r = /[/]\\/*/; r.test('/')", 'regex with / in class and escaped /');
+assertEquivalent('const x = 10, y = 2; x / y / 1', 'division is not a regex');
+assertEquivalent("(function () { return /ab+c/i.test('ABBC'); })()", 'regex after return');
+
+console.log('\n=== Template literals ===');
+assertEquivalent('const s = true; `${s ? `https://a` : `http://b`}/x`', 'nested templates');
+assertEquivalent(
+  'const o = { a: 1 }; `${(() => { return { b: o.a }; })().b}` // tail',
+  'braces inside substitution'
+);
+assertEquivalent('`${`${`deep // ${1 + 1}`}`}` /* c */', 'deeply nested templates');
+assertEquivalent("`${'}'}` + `${\"`\"}`", 'quotes containing } and ` inside substitutions');
+assertEquivalent('`a\\${not} ${/* gone */ 1}`', 'escaped ${ and comment in substitution');
+
+// Test results
+console.log('\n' + '='.repeat(50));
+console.log(`📊 Test Results: ${passedTests}/${totalTests} tests passed`);
+
+if (passedTests === totalTests) {
+  console.log('✅ All tests passed!');
+  process.exit(0);
+} else {
+  console.log('❌ Some tests failed');
+  process.exit(1);
+}